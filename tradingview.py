@@ -1,74 +1,96 @@
 import math
+import numpy as np
 import pandas as pd
-from dataclasses import dataclass
+from functools import cached_property
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Record layout of a trade; trades are stored as a structured array of this dtype.
+TRADE_DTYPE = np.dtype([
+    ("type", "i1"),
+    ("entry_date", "datetime64[ns]"),
+    ("exit_date", "datetime64[ns]"),
+    ("entry_signal", "O"),
+    ("exit_signal", "O"),
+    ("entry_price", "f8"),
+    ("exit_price", "f8"),
+    ("contract", "f8"),
+    ("profit", "f8"),
+    ("profit_percent", "f8"),
+    ("draw_down", "f8"),
+    ("draw_down_percent", "f8"),
+    ("run_up", "f8"),
+    ("run_up_percent", "f8"),
+    ("cum_profit", "f8"),
+    ("cum_profit_percent", "f8"),
+])
+
+# Fields that are only ever reduced in the summary; these follow the `precision` of DataFrameTV.
+# Prices and contract stay float64: they make up the initial capital and buy & hold.
+SUMMARY_FIELDS = ("profit", "profit_percent", "draw_down", "draw_down_percent",
+                  "run_up", "run_up_percent")
+
+
+def trade_dtype(precision: str = "float64") -> np.dtype:
+    """
+    Returns TRADE_DTYPE with the SUMMARY_FIELDS stored as `precision` ("float64" or "float32").
+    """
+    if precision not in ("float64", "float32"):
+        raise ValueError(
+            f"precision must be 'float64' or 'float32', not {precision!r}")
+    fields = [(name, precision if name in SUMMARY_FIELDS else dtype)
+              for name, (dtype, _) in TRADE_DTYPE.fields.items()]
+    return np.dtype(fields)
+
+
+# Labels of the performance summary, in order.
+SUMMARY_INDEX = [
+    "Net Profit", "Net Profit %", "Gross Profit", "Gross Profit %",
+    "Gross Loss", "Gross Loss %", "Max Run Up", "Max Run Up %",
+    "Max Draw Down", "Max Draw Down %", "Buy and Hold", "Buy and Hold %",
+    "Profit Factor", "Max Contract Held", "Total Closed Trades",
+    "Total Open Trades", "Number Winning Trades", "Number Losing Trades",
+    "Avg Trade", "Avg Trade %", "Avg Winning Trade", "Avg Winning Trade %",
+    "Avg Losing Trade", "Avg Losing Trade %", "Ratio Avg Win Avg Loss",
+    "Largest Winning Trade", "Largest Winning Trade %",
+    "Largest Losing Trade", "Largest Losing Trade %", "Avg Bars in Trades",
+    "Avg Bars in Winning Trades", "Avg Bars in Losing Trades"
+]
+
+# Names of the aggregates returned by the summary kernel, in order.
+_AGGREGATES = (
+    "net_profit", "n_profit", "gross_profit", "gross_loss", "n_win", "n_loss",
+    "number_winning_trades", "number_losing_trades", "total_open_trades",
+    "profit_percent_sum", "n_profit_percent", "win_profit_percent_sum",
+    "n_win_profit_percent", "loss_profit_percent_sum",
+    "n_loss_profit_percent", "largest_winning_trade",
+    "largest_winning_trade_percent", "largest_losing_trade",
+    "largest_losing_trade_percent", "max_run_up", "max_run_up_percent",
+    "max_draw_down", "max_draw_down_percent", "max_contract_held")
 
 
 class Type:
-    LONG = 'long'
-    SHORT = 'short'
-
-
-@dataclass
-class Trade:
-    type: Type
-    entry_date: float
-    entry_price: float
-    contract: float
-    entry_signal: str = None
-    exit_date: float = None
-    exit_price: float = None
-    exit_signal: str = None
-    profit: float = None
-    profit_percent: float = None
-    draw_down: float = None
-    draw_down_percent: float = None
-    run_up: float = None
-    run_up_percent: float = None
-    cum_profit: float = None
-    cum_profit_percent: float = None
-
-
-@dataclass
-class PerformanceSummary:
-    net_profit: float
-    net_profit_percent: float
-    gross_profit: float
-    gross_profit_percent: float
-    gross_loss: float
-    gross_loss_percent: float
-    max_run_up: float
-    max_run_up_percent: float
-    max_draw_down: float
-    max_draw_down_percent: float
-    buy_and_hold: float
-    buy_and_hold_percent: float
-    profit_factor: float
-    max_contract_held: float
-    total_closed_trades: int
-    total_open_trades: int
-    number_winning_trades: int
-    number_losing_trades: int
-    percent_profitable: float
-    avg_trade: float
-    avg_trade_percent: float
-    avg_winning_trade: float
-    avg_winning_trade_percent: float
-    avg_losing_trade: float
-    avg_losing_trade_percent: float
-    ratio_avg_win_avg_loss: float
-    largest_winning_trade: float
-    largest_winning_trade_percent: float
-    largest_losing_trade: float
-    largest_losing_trade_percent: float
-    avg_bars_in_trades: int
-    avg_bars_in_winning_trades: int
-    avg_bars_in_losing_trades: int
+    """
+    Trade direction codes stored in the "type" field of TRADE_DTYPE.
+    """
+    LONG = 0
+    SHORT = 1
 
 
 class DataFrameTV:
     """
     Computes the performance summary for a list of transactions downloaded from site TradingView.
     
+    Parameters
+    ----------
+    trades: Trades DataFrame downloaded from site TradingView.
+    precision: "float64" (default) or "float32". With "float32" the profit, run-up and draw-down columns
+        are stored in single precision, which shrinks the memory scanned by the summary; totals are still
+        summed in double precision.
+    
     Example:
     --------
     Read trades from file:
@@ -126,26 +148,37 @@ class DataFrameTV:
     2022-08-31    26979.87     27.346035      36995.39       37.497483  ...                   -3.63     0 days 17:30:15             0 days 15:19:04            1 days 02:15:00
     """
 
-    def __init__(self, trades: pd.DataFrame):
-        self.trades = [
-            ConvertTradeTV.convert(trade[1])
-            for trade in trades.groupby("Trade #") if len(trade) == 2
-        ]
+    def __init__(self, trades: pd.DataFrame, precision: str = "float64"):
+        self.trades = ConvertTradeTV.convert_all(trades, precision)
+        # The cached summaries below are only valid for these exact trades.
+        self.trades.flags.writeable = False
+        self._long_mask = self.trades["type"] == Type.LONG
+        self._short_mask = ~self._long_mask
 
     @property
     def performance_summary(self):
-        return PerformanceSummary.performance_summary(self.trades)
+        return self._performance_summary.copy()
 
     @property
     def performance_summary_long(self):
-        long_trades = [trade for trade in self.trades if trade.type == "long"]
-        return PerformanceSummary.performance_summary(long_trades)
+        return self._performance_summary_long.copy()
 
     @property
     def performance_summary_short(self):
-        short_trades = [
-            trade for trade in self.trades if trade.type == "short"
-        ]
+        return self._performance_summary_short.copy()
+
+    @cached_property
+    def _performance_summary(self):
+        return PerformanceSummary.performance_summary(self.trades)
+
+    @cached_property
+    def _performance_summary_long(self):
+        long_trades = np.compress(self._long_mask, self.trades)
+        return PerformanceSummary.performance_summary(long_trades)
+
+    @cached_property
+    def _performance_summary_short(self):
+        short_trades = np.compress(self._short_mask, self.trades)
         return PerformanceSummary.performance_summary(short_trades)
 
     def monthly_performance(self,
@@ -163,372 +196,452 @@ class DataFrameTV:
             self.trades, with_separate_long_short)
 
     def __repr__(self) -> str:
-        return self.performance_summary.__repr__()
+        return self._performance_summary.__repr__()
 
 
 class ConvertTradeTV:
 
     @staticmethod
-    def convert(pair_trade: pd.DataFrame) -> Trade:
-        _entry = pair_trade.iloc[1]
-        _exit = pair_trade.iloc[0]
-        _type = _entry.Type.split(" ")[1].lower()
-        trade = Trade(
-            type=Type.LONG if _type == "long" else Type.SHORT,
-            entry_date=pd.to_datetime(_entry["Date/Time"]),
-            exit_date=pd.to_datetime(_exit["Date/Time"]),
-            entry_price=_entry["Price"],
-            exit_price=_exit["Price"],
-            contract=_entry["Contracts"],
-            entry_signal=_entry["Signal"],
-            exit_signal=_exit["Signal"],
-            profit=_entry["Profit USDT"],
-            profit_percent=_entry["Profit %"],
-            draw_down=_entry["Drawdown USDT"],
-            draw_down_percent=_entry["Drawdown %"],
-            run_up=_entry["Run-up USDT"],
-            run_up_percent=_entry["Run-up %"],
-            cum_profit=_entry["Cum. Profit USDT"],
-            cum_profit_percent=_entry["Cum. Profit %"],
-        )
-        return trade
-
-
-class PerformanceSummary:
-
-    @staticmethod
-    def performance_summary(trades: list or pd.DataFrame):
-        net_profit = CalculatePerformanceSummary.net_profit(trades)
-        net_profit_percent = CalculatePerformanceSummary.net_profit_percent(
-            trades)
-        gross_profit = CalculatePerformanceSummary.gross_profit(trades)
-        gross_profit_percent = CalculatePerformanceSummary.gross_profit_percent(
-            trades)
-        gross_loss = CalculatePerformanceSummary.gross_loss(trades)
-        gross_loss_percent = CalculatePerformanceSummary.gross_loss_percent(
-            trades)
-        max_run_up = CalculatePerformanceSummary.max_run_up(trades)
-        max_run_up_percent = CalculatePerformanceSummary.max_run_up_percent(
-            trades)
-        max_draw_down = CalculatePerformanceSummary.max_draw_down(trades)
-        max_draw_down_percent = CalculatePerformanceSummary.max_draw_down_percent(
-            trades)
-        buy_and_hold = CalculatePerformanceSummary.buy_and_hold(trades)
-        buy_and_hold_percent = CalculatePerformanceSummary.buy_and_hold_percent(
-            trades)
-        profit_factor = CalculatePerformanceSummary.profit_factor(trades)
-        max_contract_held = CalculatePerformanceSummary.max_contract_held(
-            trades)
-        total_closed_trades = CalculatePerformanceSummary.total_closed_trades(
-            trades)
-        total_open_trades = CalculatePerformanceSummary.total_open_trades(
-            trades)
-        number_winning_trades = CalculatePerformanceSummary.number_winning_trades(
-            trades)
-        number_losing_trades = CalculatePerformanceSummary.number_losing_trades(
-            trades)
-        avg_trade = CalculatePerformanceSummary.avg_trade(trades)
-        avg_trade_percent = CalculatePerformanceSummary.avg_trade_percent(
-            trades)
-        avg_winning_trade = CalculatePerformanceSummary.avg_winning_trade(
-            trades)
-        avg_winning_trade_percent = CalculatePerformanceSummary.avg_winning_trade_percent(
-            trades)
-        avg_losing_trade = CalculatePerformanceSummary.avg_losing_trade(trades)
-        avg_losing_trade_percent = CalculatePerformanceSummary.avg_losing_trade_percent(
-            trades)
-        ratio_avg_win_avg_loss = CalculatePerformanceSummary.ratio_avg_win_avg_loss(
-            trades)
-        largest_winning_trade = CalculatePerformanceSummary.largest_winning_trade(
-            trades)
-        largest_winning_trade_percent = CalculatePerformanceSummary.largest_winning_trade_percent(
-            trades)
-        largest_losing_trade = CalculatePerformanceSummary.largest_losing_trade(
-            trades)
-        largest_losing_trade_percent = CalculatePerformanceSummary.largest_losing_trade_percent(
-            trades)
-        avg_bars_in_trades = CalculatePerformanceSummary.avg_bars_in_trades(
-            trades)
-        avg_bars_in_winning_trades = CalculatePerformanceSummary.avg_bars_in_winning_trades(
-            trades)
-        avg_bars_in_losing_trades = CalculatePerformanceSummary.avg_bars_in_losing_trades(
-            trades)
-        data = [
-            net_profit, net_profit_percent, gross_profit, gross_profit_percent,
-            gross_loss, gross_loss_percent, max_run_up, max_run_up_percent,
-            max_draw_down, max_draw_down_percent, buy_and_hold,
-            buy_and_hold_percent, profit_factor, max_contract_held,
-            total_closed_trades, total_open_trades, number_winning_trades,
-            number_losing_trades, avg_trade, avg_trade_percent,
-            avg_winning_trade, avg_winning_trade_percent, avg_losing_trade,
-            avg_losing_trade_percent, ratio_avg_win_avg_loss,
-            largest_winning_trade, largest_winning_trade_percent,
-            largest_losing_trade, largest_losing_trade_percent,
-            avg_bars_in_trades, avg_bars_in_winning_trades,
-            avg_bars_in_losing_trades
-        ]
-        index = [
-            "Net Profit", "Net Profit %", "Gross Profit", "Gross Profit %",
-            "Gross Loss", "Gross Loss %", "Max Run Up", "Max Run Up %",
-            "Max Draw Down", "Max Draw Down %", "Buy and Hold",
-            "Buy and Hold %", "Profit Factor", "Max Contract Held",
-            "Total Closed Trades", "Total Open Trades",
-            "Number Winning Trades", "Number Losing Trades", "Avg Trade",
-            "Avg Trade %", "Avg Winning Trade", "Avg Winning Trade %",
-            "Avg Losing Trade", "Avg Losing Trade %", "Ratio Avg Win Avg Loss",
-            "Largest Winning Trade", "Largest Winning Trade %",
-            "Largest Losing Trade", "Largest Losing Trade %",
-            "Avg Bars in Trades", "Avg Bars in Winning Trades",
-            "Avg Bars in Losing Trades"
-        ]
-        res = pd.Series(data, index=index)
-        return res
-
-    @staticmethod
-    def monthly_performance(trades: list or pd.DataFrame,
-                            with_separate_long_short: bool = False):
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        trades.index = pd.to_datetime(trades.entry_date)
-        monthly = trades.groupby(pd.Grouper(freq="M"))
-        res = pd.DataFrame()
-        for name, group in monthly:
-            name = name.strftime("%Y-%m-%d")
-            performance = PerformanceSummary.performance_summary(group)
-            performance.name = name
-            res = pd.concat([res, performance], axis=1)
-            if with_separate_long_short:
-                performance_long = PerformanceSummary.performance_summary(
-                    group[group.type == "long"])
-                performance_long.name = str(name) + " Long"
-                performance_short = PerformanceSummary.performance_summary(
-                    group[group.type == "short"])
-                performance_short.name = str(name) + " Short"
-                res = pd.concat([res, performance_long, performance_short],
-                                axis=1)
-        return res.T
-
-
-class CalculatePerformanceSummary:
-
-    @staticmethod
-    def initial_capital(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            return trades[0].entry_price * trades[0].contract
-        return trades.iloc[0].entry_price * trades.iloc[0].contract
-
-    @staticmethod
-    def net_profit(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return trades.profit.sum()
-
-    @staticmethod
-    def net_profit_percent(trades: list or pd.DataFrame) -> float:
-        net_profit = CalculatePerformanceSummary.net_profit(trades)
-        initial_capital = CalculatePerformanceSummary.initial_capital(trades)
-        return (net_profit / initial_capital) * 100
-
-    @staticmethod
-    def gross_profit(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return trades[trades.profit > 0].profit.sum()
-
-    @staticmethod
-    def gross_profit_percent(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        gross_profit = CalculatePerformanceSummary.gross_profit(trades)
-        initial_capital = CalculatePerformanceSummary.initial_capital(trades)
-        return (gross_profit / initial_capital) * 100
-
-    @staticmethod
-    def gross_loss(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return trades[trades.profit < 0].profit.sum()
-
-    @staticmethod
-    def gross_loss_percent(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        gross_loss = CalculatePerformanceSummary.gross_loss(trades)
-        initial_capital = CalculatePerformanceSummary.initial_capital(trades)
-        return (gross_loss / initial_capital) * 100
-
-    @staticmethod
-    def max_run_up(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return trades.run_up.max()
+    def convert(pair_trade: pd.DataFrame) -> np.void:
+        """
+        Converts the exit and entry rows of one trade into a TRADE_DTYPE record.
+        """
+        return ConvertTradeTV.convert_all(pair_trade)[0]
 
     @staticmethod
-    def max_run_up_percent(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return trades.run_up_percent.max()
+    def convert_all(trades: pd.DataFrame,
+                    precision: str = "float64") -> np.ndarray:
+        """
+        Converts every entry/exit pair of a TradingView trades DataFrame at once into a TRADE_DTYPE array.
+        """
+        dtype = trade_dtype(precision)
+        # Only trades with both an exit and an entry row can be paired.
+        sizes = trades.groupby("Trade #").size()
+        trades = trades[trades["Trade #"].isin(sizes.index[sizes == 2])]
+        trades = trades.sort_values("Trade #", kind="stable")
+        _entry = trades.iloc[1::2]
+        _exit = trades.iloc[0::2]
+        _type = _entry["Type"].str.split(" ", n=1).str[1].str.lower()
+        converted = np.empty(len(_entry), dtype=dtype)
+        converted["type"] = np.where(_type == "long", Type.LONG, Type.SHORT)
+        converted["entry_date"] = pd.to_datetime(_entry["Date/Time"])
+        converted["exit_date"] = pd.to_datetime(_exit["Date/Time"])
+        converted["entry_signal"] = _entry["Signal"]
+        converted["exit_signal"] = _exit["Signal"]
+        converted["entry_price"] = _entry["Price"]
+        converted["exit_price"] = _exit["Price"]
+        converted["contract"] = _entry["Contracts"]
+        converted["profit"] = _entry["Profit USDT"]
+        converted["profit_percent"] = _entry["Profit %"]
+        converted["draw_down"] = _entry["Drawdown USDT"]
+        converted["draw_down_percent"] = _entry["Drawdown %"]
+        converted["run_up"] = _entry["Run-up USDT"]
+        converted["run_up_percent"] = _entry["Run-up %"]
+        converted["cum_profit"] = _entry["Cum. Profit USDT"]
+        converted["cum_profit_percent"] = _entry["Cum. Profit %"]
+        return converted
 
-    @staticmethod
-    def max_draw_down(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return -trades.draw_down.max()
 
-    @staticmethod
-    def max_draw_down_percent(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return -trades.draw_down_percent.max()
+class PerformanceSummary:
 
     @staticmethod
-    def buy_and_hold(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        first_price = trades.entry_price.iloc[0]
-        last_price = trades.iloc[-1].exit_price
+    def performance_summary(trades: list or pd.DataFrame or np.ndarray):
+        """
+        Computes every summary metric from the aggregates of a single pass over the trades.
+        """
+        trades = _as_trade_array(trades)
+        entry_price = trades["entry_price"]
+        exit_price = trades["exit_price"]
+        contract = trades["contract"]
+        aggregates = dict(
+            zip(
+                _AGGREGATES,
+                _summary_kernel(trades["profit"], trades["profit_percent"],
+                                trades["run_up"], trades["run_up_percent"],
+                                trades["draw_down"],
+                                trades["draw_down_percent"], contract)))
+
+        first_price = float(entry_price[0])
+        first_contract = float(contract[0])
+        last_price = exit_price[-1]
         if math.isnan(last_price):
-            last_price = trades.iloc[-1].entry_price
-        return (last_price - first_price) * trades.contract.iloc[0]
-
-    @staticmethod
-    def buy_and_hold_percent(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        buy_and_hold = CalculatePerformanceSummary.buy_and_hold(trades)
-        initial_capital = CalculatePerformanceSummary.initial_capital(trades)
-        return (buy_and_hold / initial_capital) * 100
-
-    @staticmethod
-    def profit_factor(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        gross_profit = CalculatePerformanceSummary.gross_profit(trades)
-        gross_loss = abs(CalculatePerformanceSummary.gross_loss(trades))
-        if gross_profit != 0:
-            return gross_profit / gross_loss
-        return gross_profit
-
-    @staticmethod
-    def max_contract_held(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return trades.contract.max()
-
-    @staticmethod
-    def total_closed_trades(trades: list or pd.DataFrame) -> int:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-            trades = trades.dropna(subset=["contract"])
-        return len(trades)
-
-    @staticmethod
-    def total_open_trades(trades: list or pd.DataFrame) -> int:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return trades.contract.isna().sum()
-
-    @staticmethod
-    def number_winning_trades(trades: list or pd.DataFrame) -> int:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return trades[trades.profit > 0].contract.count()
+            last_price = entry_price[-1]
+        win = trades["profit"] > 0
+        loss = trades["profit"] < 0
+        duration = _duration_ns(trades)
+        aggregates.update(
+            total_trades=len(contract),
+            initial_capital=first_price * first_contract,
+            first_price=first_price,
+            first_contract=first_contract,
+            last_price=last_price,
+            avg_duration=_nanreduce(np.nanmean, duration),
+            avg_win_duration=_nanreduce(np.nanmean, duration[win]),
+            avg_loss_duration=_nanreduce(np.nanmean, duration[loss]),
+        )
+        return pd.Series(_summary_metrics(aggregates), index=SUMMARY_INDEX)
 
     @staticmethod
-    def number_losing_trades(trades: list or pd.DataFrame) -> int:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return trades[trades.profit < 0].contract.count()
+    def monthly_performance(trades: list or pd.DataFrame or np.ndarray,
+                            with_separate_long_short: bool = False):
+        trades = _as_trade_array(trades)
+        res = _monthly_summary(trades)
+        if not with_separate_long_short:
+            return res
+        frames = [res]
+        long_mask = trades["type"] == Type.LONG
+        for mask, suffix in ((long_mask, " Long"), (~long_mask, " Short")):
+            summary = _monthly_summary(np.compress(mask, trades))
+            summary.index += suffix
+            frames.append(summary)
+        # "<month>" sorts before "<month> Long" and "<month> Short".
+        return pd.concat(frames).sort_index()
+
+
+def _summary_metrics(aggregates) -> list:
+    """
+    Derives the summary metrics from the trade aggregates.
 
-    @staticmethod
-    def avg_trade(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return trades.profit.mean()
+    The aggregates are either scalars for a single summary, or per-month Series for the monthly performance.
+    """
+    net_profit = aggregates["net_profit"]
+    gross_profit = aggregates["gross_profit"]
+    gross_loss = aggregates["gross_loss"]
+    initial_capital = aggregates["initial_capital"]
+    buy_and_hold = (aggregates["last_price"] -
+                    aggregates["first_price"]) * aggregates["first_contract"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        avg_winning_trade = np.divide(gross_profit, aggregates["n_win"])
+        avg_losing_trade = np.divide(gross_loss, aggregates["n_loss"])
+        # Losses are never positive, so negation stands in for abs(). Adding
+        # (gross_profit == 0) to the divisor keeps the factor branchless: no
+        # profit gives 0 even without losses, any other profit over no losses
+        # gives inf.
+        profit_factor = np.divide(gross_profit,
+                                  -gross_loss + (gross_profit == 0))
+        ratio_avg_win_avg_loss = np.divide(avg_winning_trade,
+                                           -avg_losing_trade)
+        return [
+            net_profit,
+            np.divide(net_profit, initial_capital) * 100,
+            gross_profit,
+            np.divide(gross_profit, initial_capital) * 100,
+            gross_loss,
+            np.divide(gross_loss, initial_capital) * 100,
+            aggregates["max_run_up"],
+            aggregates["max_run_up_percent"],
+            -aggregates["max_draw_down"],
+            -aggregates["max_draw_down_percent"],
+            buy_and_hold,
+            np.divide(buy_and_hold, initial_capital) * 100,
+            profit_factor,
+            aggregates["max_contract_held"],
+            aggregates["total_trades"] - aggregates["total_open_trades"],
+            aggregates["total_open_trades"],
+            aggregates["number_winning_trades"],
+            aggregates["number_losing_trades"],
+            np.divide(net_profit, aggregates["n_profit"]),
+            np.divide(aggregates["profit_percent_sum"],
+                      aggregates["n_profit_percent"]),
+            avg_winning_trade,
+            np.divide(aggregates["win_profit_percent_sum"],
+                      aggregates["n_win_profit_percent"]),
+            avg_losing_trade,
+            np.divide(aggregates["loss_profit_percent_sum"],
+                      aggregates["n_loss_profit_percent"]),
+            ratio_avg_win_avg_loss,
+            aggregates["largest_winning_trade"],
+            aggregates["largest_winning_trade_percent"],
+            aggregates["largest_losing_trade"],
+            aggregates["largest_losing_trade_percent"],
+            _round_duration(aggregates["avg_duration"]),
+            _round_duration(aggregates["avg_win_duration"]),
+            _round_duration(aggregates["avg_loss_duration"]),
+        ]
 
-    @staticmethod
-    def avg_trade_percent(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return trades.profit_percent.mean()
 
-    @staticmethod
-    def avg_winning_trade(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return trades[trades.profit > 0].profit.mean()
+def _monthly_aggregates(trades: np.ndarray) -> pd.DataFrame:
+    """
+    Computes the trade aggregates of every month in a single groupby pass.
 
-    @staticmethod
-    def avg_winning_trade_percent(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return trades[trades.profit > 0].profit_percent.mean()
+    Win/loss and first/last selections are precomputed as NaN-masked columns so that plain named aggregations
+    produce the same aggregates as the summary kernel. The columns are upcast to float64 so the groupby sums
+    accumulate and return double precision, as the kernel does for float32 trades.
+    """
+    profit = trades["profit"].astype(np.float64)
+    profit_percent = trades["profit_percent"].astype(np.float64)
+    entry_price = trades["entry_price"]
+    exit_price = trades["exit_price"]
+    contract = trades["contract"]
+    duration = _duration_ns(trades)
+    win = profit > 0
+    loss = profit < 0
+    month = (pd.DatetimeIndex(trades["entry_date"]) +
+             pd.offsets.MonthEnd(0)).normalize()
+    first = ~month.duplicated(keep="first")
+    last = ~month.duplicated(keep="last")
+    last_price = np.where(np.isnan(exit_price), entry_price, exit_price)
+    frame = pd.DataFrame(
+        {
+            "profit": profit,
+            "profit_percent": profit_percent,
+            "win_profit": np.where(win, profit, np.nan),
+            "loss_profit": np.where(loss, profit, np.nan),
+            "win_profit_percent": np.where(win, profit_percent, np.nan),
+            "loss_profit_percent": np.where(loss, profit_percent, np.nan),
+            "win_contract": np.where(win, contract, np.nan),
+            "loss_contract": np.where(loss, contract, np.nan),
+            "open": np.isnan(contract),
+            "contract": contract,
+            "run_up": trades["run_up"].astype(np.float64),
+            "run_up_percent": trades["run_up_percent"].astype(np.float64),
+            "draw_down": trades["draw_down"].astype(np.float64),
+            "draw_down_percent": trades["draw_down_percent"].astype(
+                np.float64),
+            "first_price": np.where(first, entry_price, np.nan),
+            "first_contract": np.where(first, contract, np.nan),
+            "last_price": np.where(last, last_price, np.nan),
+            "duration": duration,
+            "win_duration": np.where(win, duration, np.nan),
+            "loss_duration": np.where(loss, duration, np.nan),
+        },
+        index=month)
+    aggregates = frame.groupby(level=0).agg(
+        net_profit=("profit", "sum"),
+        n_profit=("profit", "count"),
+        gross_profit=("win_profit", "sum"),
+        gross_loss=("loss_profit", "sum"),
+        n_win=("win_profit", "count"),
+        n_loss=("loss_profit", "count"),
+        number_winning_trades=("win_contract", "count"),
+        number_losing_trades=("loss_contract", "count"),
+        total_open_trades=("open", "sum"),
+        profit_percent_sum=("profit_percent", "sum"),
+        n_profit_percent=("profit_percent", "count"),
+        win_profit_percent_sum=("win_profit_percent", "sum"),
+        n_win_profit_percent=("win_profit_percent", "count"),
+        loss_profit_percent_sum=("loss_profit_percent", "sum"),
+        n_loss_profit_percent=("loss_profit_percent", "count"),
+        largest_winning_trade=("win_profit", "max"),
+        largest_winning_trade_percent=("win_profit_percent", "max"),
+        largest_losing_trade=("loss_profit", "min"),
+        largest_losing_trade_percent=("loss_profit_percent", "min"),
+        max_run_up=("run_up", "max"),
+        max_run_up_percent=("run_up_percent", "max"),
+        max_draw_down=("draw_down", "max"),
+        max_draw_down_percent=("draw_down_percent", "max"),
+        max_contract_held=("contract", "max"),
+        total_trades=("contract", "size"),
+        first_price=("first_price", "max"),
+        first_contract=("first_contract", "max"),
+        last_price=("last_price", "max"),
+        avg_duration=("duration", "mean"),
+        avg_win_duration=("win_duration", "mean"),
+        avg_loss_duration=("loss_duration", "mean"),
+    )
+    aggregates["initial_capital"] = (aggregates["first_price"] *
+                                     aggregates["first_contract"])
+    return aggregates
+
+
+def _monthly_summary(trades: np.ndarray) -> pd.DataFrame:
+    aggregates = _monthly_aggregates(trades)
+    return pd.DataFrame(dict(zip(SUMMARY_INDEX,
+                                 _summary_metrics(aggregates))),
+                        index=aggregates.index.strftime("%Y-%m-%d"))
+
+
+def _as_trade_array(
+        trades: list or pd.DataFrame or np.ndarray) -> np.ndarray:
+    """
+    Coerces a list of trade records or a trades DataFrame into a TRADE_DTYPE array.
+    """
+    if isinstance(trades, list):
+        return np.array(trades, dtype=TRADE_DTYPE)
+    if isinstance(trades, pd.DataFrame):
+        converted = np.empty(len(trades), dtype=TRADE_DTYPE)
+        for name in TRADE_DTYPE.names:
+            converted[name] = trades[name]
+        return converted
+    return trades
 
-    @staticmethod
-    def avg_losing_trade(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return trades[trades.profit < 0].profit.mean()
 
-    @staticmethod
-    def avg_losing_trade_percent(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return trades[trades.profit < 0].profit_percent.mean()
+def _nanreduce(func, values: np.ndarray) -> float:
+    """
+    Applies a NaN-skipping reduction, returning NaN for an empty or all-NaN selection as pandas does.
+    """
+    if np.isnan(values).all():
+        return np.nan
+    return func(values)
 
-    @staticmethod
-    def ratio_avg_win_avg_loss(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        avg_winning_trade = CalculatePerformanceSummary\
-            .avg_winning_trade(trades)
-        avg_losing_trade = abs(CalculatePerformanceSummary\
-            .avg_losing_trade(trades))
-        return avg_winning_trade / avg_losing_trade
 
-    @staticmethod
-    def largest_winning_trade(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return trades[trades.profit > 0].profit.max()
+def _duration_ns(trades: np.ndarray) -> np.ndarray:
+    """
+    Returns the trade durations in nanoseconds, from the int64 representation of the dates.
 
-    @staticmethod
-    def largest_winning_trade_percent(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return trades[trades.profit > 0].profit_percent.max()
+    The result is float64 so that trades with a missing date can be NaN and skipped by the means.
+    """
+    entry_date = trades["entry_date"]
+    exit_date = trades["exit_date"]
+    duration = (exit_date.astype("i8") - entry_date.astype("i8")).astype("f8")
+    duration[np.isnat(entry_date) | np.isnat(exit_date)] = np.nan
+    return duration
 
-    @staticmethod
-    def largest_losing_trade(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return trades[trades.profit < 0].profit.min()
 
-    @staticmethod
-    def largest_losing_trade_percent(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        return trades[trades.profit < 0].profit_percent.min()
+def _round_duration(duration_ns: float or pd.Series):
+    """
+    Rounds durations in nanoseconds to whole seconds, as Timedelta (NaT where NaN).
+    """
+    return pd.to_timedelta(np.round(duration_ns, -9))
 
-    @staticmethod
-    def avg_bars_in_trades(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        duration = trades.exit_date - trades.entry_date
-        return duration.mean().round("1s")
 
-    @staticmethod
-    def avg_bars_in_winning_trades(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        trades = trades[trades.profit > 0]
-        duration = trades.exit_date - trades.entry_date
-        return duration.mean().round("1s")
+def _summary_arrays(profit, profit_percent, run_up, run_up_percent, draw_down,
+                    draw_down_percent, contract) -> tuple:
+    """
+    NumPy implementation of the summary kernel, used when Numba is not installed.
+
+    It must return the same aggregates as _summary_loop. Check with
+    ``python -c "import doctest, tradingview as tv; doctest.run_docstring_examples(tv._summary_arrays, vars(tv))"``:
+
+    >>> def mismatches(*columns):
+    ...     loop, arrays = _summary_loop(*columns), _summary_arrays(*columns)
+    ...     return [name for name, a, b in zip(_AGGREGATES, loop, arrays)
+    ...             if not np.isclose(a, b, equal_nan=True)]
+    >>> nan = np.nan
+    >>> profit = np.array([12.5, -4.0, nan, 3.0, -1.5])
+    >>> profit_percent = np.array([1.2, -0.4, 0.1, nan, -0.2])
+    >>> run_up = np.array([14.0, 1.0, 2.0, nan, 0.5])
+    >>> draw_down = np.array([2.0, 5.0, 1.0, 0.5, nan])
+    >>> contract = np.array([1.0, 2.0, 1.5, nan, 1.0])  # the fourth trade is open
+    >>> mismatches(profit, profit_percent, run_up, run_up / 10, draw_down,
+    ...            draw_down / 10, contract)
+    []
+    >>> winners = np.abs(profit)  # no losing trades
+    >>> mismatches(winners, np.abs(profit_percent), run_up, run_up / 10,
+    ...            draw_down, draw_down / 10, contract)
+    []
+    >>> empty = np.array([])
+    >>> mismatches(*[empty] * 7)
+    []
+    """
+    win = profit > 0
+    loss = profit < 0
+    open_ = np.isnan(contract)
+    closed = ~open_
+    # Split-sum: winners and losers are reduced as whole arrays, without index
+    # selections. fmax/fmin also map NaN profits to 0, which counts as neither.
+    win_profit = np.fmax(profit, 0)
+    loss_profit = np.fmin(profit, 0)
+    n_win = np.count_nonzero(win_profit)
+    n_loss = np.count_nonzero(loss_profit)
+    win_profit_percent = profit_percent[win]
+    loss_profit_percent = profit_percent[loss]
+    return (
+        np.nansum(profit, dtype=np.float64),
+        np.count_nonzero(~np.isnan(profit)),
+        win_profit.sum(dtype=np.float64),
+        loss_profit.sum(dtype=np.float64),
+        n_win,
+        n_loss,
+        np.count_nonzero(closed[win]),
+        np.count_nonzero(closed[loss]),
+        len(contract) - np.count_nonzero(closed),
+        np.nansum(profit_percent, dtype=np.float64),
+        np.count_nonzero(~np.isnan(profit_percent)),
+        np.nansum(win_profit_percent, dtype=np.float64),
+        np.count_nonzero(~np.isnan(win_profit_percent)),
+        np.nansum(loss_profit_percent, dtype=np.float64),
+        np.count_nonzero(~np.isnan(loss_profit_percent)),
+        win_profit.max() if n_win else np.nan,
+        _nanreduce(np.nanmax, win_profit_percent),
+        loss_profit.min() if n_loss else np.nan,
+        _nanreduce(np.nanmin, loss_profit_percent),
+        _nanreduce(np.nanmax, run_up),
+        _nanreduce(np.nanmax, run_up_percent),
+        _nanreduce(np.nanmax, draw_down),
+        _nanreduce(np.nanmax, draw_down_percent),
+        _nanreduce(np.nanmax, contract),
+    )
+
+
+def _summary_loop(profit, profit_percent, run_up, run_up_percent, draw_down,
+                  draw_down_percent, contract) -> tuple:
+    """
+    Accumulates the summary aggregates in a single loop over the trades.
 
-    @staticmethod
-    def avg_bars_in_losing_trades(trades: list or pd.DataFrame) -> float:
-        if isinstance(trades, list):
-            trades = pd.DataFrame(trades)
-        trades = trades[trades.profit < 0]
-        duration = trades.exit_date - trades.entry_date
-        return duration.mean().round("1s")
+    NaN values are skipped like pandas does; a max/min stays NaN when nothing was accumulated.
+    """
+    nan = np.nan
+    net_profit = gross_profit = gross_loss = 0.0
+    profit_percent_sum = win_profit_percent_sum = loss_profit_percent_sum = 0.0
+    n_profit = n_win = n_loss = n_win_closed = n_loss_closed = n_open = 0
+    n_profit_percent = n_win_profit_percent = n_loss_profit_percent = 0
+    largest_win = largest_win_percent = nan
+    largest_loss = largest_loss_percent = nan
+    max_run_up = max_run_up_percent = nan
+    max_draw_down = max_draw_down_percent = max_contract = nan
+    for i in range(len(profit)):
+        p = profit[i]
+        pp = profit_percent[i]
+        c = contract[i]
+        is_open = c != c
+        if is_open:
+            n_open += 1
+        elif not c <= max_contract:
+            max_contract = c
+        if p == p:
+            net_profit += p
+            n_profit += 1
+        if pp == pp:
+            profit_percent_sum += pp
+            n_profit_percent += 1
+        if p > 0:
+            gross_profit += p
+            n_win += 1
+            if not is_open:
+                n_win_closed += 1
+            if not p <= largest_win:
+                largest_win = p
+            if pp == pp:
+                win_profit_percent_sum += pp
+                n_win_profit_percent += 1
+                if not pp <= largest_win_percent:
+                    largest_win_percent = pp
+        elif p < 0:
+            gross_loss += p
+            n_loss += 1
+            if not is_open:
+                n_loss_closed += 1
+            if not p >= largest_loss:
+                largest_loss = p
+            if pp == pp:
+                loss_profit_percent_sum += pp
+                n_loss_profit_percent += 1
+                if not pp >= largest_loss_percent:
+                    largest_loss_percent = pp
+        x = run_up[i]
+        if x == x and not x <= max_run_up:
+            max_run_up = x
+        x = run_up_percent[i]
+        if x == x and not x <= max_run_up_percent:
+            max_run_up_percent = x
+        x = draw_down[i]
+        if x == x and not x <= max_draw_down:
+            max_draw_down = x
+        x = draw_down_percent[i]
+        if x == x and not x <= max_draw_down_percent:
+            max_draw_down_percent = x
+    return (net_profit, n_profit, gross_profit, gross_loss, n_win, n_loss,
+            n_win_closed, n_loss_closed, n_open, profit_percent_sum,
+            n_profit_percent, win_profit_percent_sum, n_win_profit_percent,
+            loss_profit_percent_sum, n_loss_profit_percent, largest_win,
+            largest_win_percent, largest_loss, largest_loss_percent,
+            max_run_up, max_run_up_percent, max_draw_down,
+            max_draw_down_percent, max_contract)
+
+
+# fastmath is left off: the NaN checks above rely on IEEE comparisons.
+if njit is not None:
+    _summary_kernel = njit(cache=True)(_summary_loop)
+else:
+    _summary_kernel = _summary_arrays